@@ -3,13 +3,11 @@ Command-Line Interface for Excel Rule Validation
 Provides a CLI for Excel file validation with natural language rules.
 """
 import argparse
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from excel_reader import ExcelReader
-from rule_parser import RuleParser
-from rule_engine import RuleEngine
-
 
 def main():
     """Main CLI entry point."""
@@ -63,6 +61,12 @@ Rule Examples (Expression-Based):
         action='store_true',
         help='Run in interactive mode to enter rules manually'
     )
+
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='Suppress per-rule status output while loading rules'
+    )
     
     args = parser.parse_args()
     
@@ -72,13 +76,42 @@ Rule Examples (Expression-Based):
         print(f"Error: Excel file '{args.excel_file}' not found.")
         sys.exit(1)
     
+    # Read the rules file up front: it's plain text, so an empty or
+    # comment-only file can bail out before paying the Excel parse cost.
+    numbered_lines = []
+    if args.rules:
+        rules_path = Path(args.rules)
+        if not rules_path.exists():
+            print(f"Error: Rules file '{args.rules}' not found.")
+            sys.exit(1)
+
+        # One read() call instead of buffered line iteration; the walrus
+        # filter strips each line exactly once
+        numbered_lines = [
+            (line_num, stripped)
+            for line_num, raw in enumerate(rules_path.read_text().splitlines(), 1)
+            if (stripped := raw.strip()) and not stripped.startswith('#')
+        ]
+
+        if not numbered_lines and not args.interactive:
+            print("\nNo rules defined. Exiting.")
+            sys.exit(0)
+
+    # Import the heavy modules (pandas/openpyxl) only once we know the
+    # invocation is valid, so --help and argument errors stay fast.
+    from excel_reader import ExcelReader
+    from rule_parser import RuleParser
+    from rule_engine import RuleEngine
+
     # Load Excel data
     print(f"Loading Excel file: {args.excel_file}")
     try:
         reader = ExcelReader(str(excel_path))
         data = reader.load(sheet_name=args.sheet)
-        print(f"✓ Loaded {len(data)} rows with {len(data.columns)} columns")
-        print(f"Columns: {', '.join(data.columns.tolist())}")
+        # Computed once: every parse_rule call below needs the same list
+        columns = data.columns.tolist()
+        print(f"✓ Loaded {len(data)} rows with {len(columns)} columns")
+        print(f"Columns: {', '.join(columns)}")
     except Exception as e:
         print(f"Error loading Excel file: {str(e)}")
         sys.exit(1)
@@ -88,25 +121,33 @@ Rule Examples (Expression-Based):
     rules = []
     
     if args.rules:
-        # Load rules from file
-        rules_path = Path(args.rules)
-        if not rules_path.exists():
-            print(f"Error: Rules file '{args.rules}' not found.")
-            sys.exit(1)
-        
+        # Parse the rules already read from the file
         print(f"\nLoading rules from: {args.rules}")
-        with open(rules_path, 'r') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    try:
-                        # Auto-generate rule names for CLI
-                        rule_name = f"Rule{line_num}"
-                        rule = rule_parser.parse_rule(line, data.columns.tolist(), rule_name=rule_name)
-                        rules.append(rule)
-                        print(f"  ✓ Rule {line_num}: {rule.name}")
-                    except Exception as e:
-                        print(f"  ✗ Rule {line_num} failed: {str(e)}")
+
+        # Rule lines are independent, so parse them in parallel. Results come
+        # back in file order, keeping line numbers in messages meaningful.
+        def parse_line(numbered):
+            line_num, line = numbered
+            try:
+                # Auto-generate rule names for CLI
+                return line_num, rule_parser.parse_rule(line, columns, rule_name=f"Rule{line_num}"), None
+            except Exception as e:
+                return line_num, None, str(e)
+
+        # Buffer the per-rule status lines and write them in one shot: a
+        # print per rule means a formatted, flushed syscall per line, which
+        # adds up on rules files with thousands of entries
+        status_lines = []
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for line_num, rule, error in executor.map(parse_line, numbered_lines):
+                if rule is not None:
+                    rules.append(rule)
+                    status_lines.append(f"  ✓ Rule {line_num}: {rule.name}")
+                else:
+                    status_lines.append(f"  ✗ Rule {line_num} failed: {error}")
+        if status_lines and not args.quiet:
+            sys.stdout.write('\n'.join(status_lines) + '\n')
+            sys.stdout.flush()
     
     elif args.interactive or not args.rules:
         # Interactive mode
@@ -131,7 +172,7 @@ Rule Examples (Expression-Based):
             try:
                 # Auto-generate rule names for interactive mode
                 rule_name = f"Rule{len(rules) + 1}"
-                rule = rule_parser.parse_rule(rule_text, data.columns.tolist(), rule_name=rule_name)
+                rule = rule_parser.parse_rule(rule_text, columns, rule_name=rule_name)
                 rules.append(rule)
                 print(f"  ✓ Added rule: {rule.name}")
             except Exception as e:
@@ -148,7 +189,10 @@ Rule Examples (Expression-Based):
     
     engine = RuleEngine()
     try:
-        results = engine.validate(data, rules)
+        # Hand the engine contiguous column arrays so each rule compiles to
+        # one boolean mask instead of per-row Python evaluation
+        col_arrays = {col: data[col].to_numpy() for col in data.columns}
+        results = engine.validate_vectorized(col_arrays, rules)
         
         # Generate report
         report = engine.generate_report()
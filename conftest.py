@@ -0,0 +1,40 @@
+"""
+Shared pytest configuration.
+Makes the project modules importable regardless of where pytest is invoked
+from, so individual test files don't need their own sys.path setup.
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import openpyxl
+import pytest
+
+from rule_parser import RuleParser
+from rule_engine import RuleEngine
+
+
+@pytest.fixture(scope='session')
+def parser():
+    """One RuleParser for the whole session, so its parse caches carry over."""
+    return RuleParser()
+
+
+@pytest.fixture
+def engine():
+    """A fresh RuleEngine per test, so results never leak between tests."""
+    return RuleEngine()
+
+
+@pytest.fixture(scope='session')
+def roundtrip_xlsx(tmp_path_factory):
+    """A small real .xlsx, written once per session for reader tests."""
+    path = tmp_path_factory.mktemp('data') / 'test_expression_data.xlsx'
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(['Equipment_ID', 'Current'])
+    for row in [('EQ001', 2.5), ('EQ002', 1.8), ('EQ003', 3.2)]:
+        ws.append(list(row))
+    wb.save(path)
+    return path
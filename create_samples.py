@@ -1,8 +1,7 @@
 """
 Create sample Excel files for testing the validation system.
 """
-import pandas as pd
-import openpyxl
+from openpyxl import Workbook
 from pathlib import Path
 
 
@@ -17,12 +16,18 @@ def create_sample_electrical_data():
         'Ratio': [5.0, 4.0, 5.625, 4.52, 4.67],
         'Status': ['Active', 'Active', 'Active', 'Active', 'Active']
     }
-    
-    df = pd.DataFrame(data)
+
+    # Write-only mode streams rows straight to disk without building the
+    # in-memory cell grid, avoiding the pandas -> openpyxl cell-by-cell copy.
     output_path = Path(__file__).parent / 'sample_electrical_data.xlsx'
-    df.to_excel(output_path, index=False, sheet_name='Equipment')
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet('Equipment')
+    ws.append(list(data.keys()))
+    for row in zip(*data.values()):
+        ws.append(list(row))
+    wb.save(output_path)
     print(f"Created sample file: {output_path}")
-    return df
+    return data
 
 
 def create_sample_rules_file():
@@ -44,9 +49,11 @@ def create_sample_rules_file():
 
 if __name__ == "__main__":
     print("Creating sample files for Excel Rule Validation System...")
-    df = create_sample_electrical_data()
+    data = create_sample_electrical_data()
     print("\nSample data:")
-    print(df)
+    print('\t'.join(data.keys()))
+    for row in zip(*data.values()):
+        print('\t'.join(str(v) for v in row))
     print()
     create_sample_rules_file()
     print("\nSample files created successfully!")
@@ -2,10 +2,35 @@
 Excel Reader Module
 Handles reading and parsing Excel files for rule validation.
 """
+import hashlib
+import os
+import xml.etree.ElementTree as ET
+import zipfile
+from pathlib import Path
+
 import openpyxl
 import pandas as pd
 from typing import Dict, List, Any, Optional
 
+# Directory for cached DataFrames (Feather format). Feather reads are
+# 10-100x faster than re-parsing the ZIP+XML of an .xlsx file.
+CACHE_DIR = Path.home() / '.cache' / 'excelrv'
+
+# In-process memo in front of the Feather cache: reloading an unchanged
+# file within one session is a dict lookup instead of any I/O. Keyed on
+# (abspath, mtime_ns, sheet, header), capped to a handful of frames.
+_LOAD_CACHE: Dict[tuple, pd.DataFrame] = {}
+_LOAD_CACHE_MAX = 8
+
+# Arrow-backed columns store strings in contiguous buffers instead of
+# per-row Python objects, which makes the vectorized equality/contains
+# checks in the rule engine much faster. Only used when pyarrow is present.
+try:
+    import pyarrow  # noqa: F401
+    READ_EXCEL_KWARGS = {'dtype_backend': 'pyarrow'}
+except ImportError:
+    READ_EXCEL_KWARGS = {}
+
 
 class ExcelReader:
     """
@@ -22,28 +47,351 @@ class ExcelReader:
         self.file_path = file_path
         self.workbook = None
         self.data_frame = None
-        
-    def load(self, sheet_name: Optional[str] = None, header_row: Optional[int] = 0) -> pd.DataFrame:
+
+    @classmethod
+    def from_dataframe(cls, data_frame: pd.DataFrame) -> 'ExcelReader':
+        """
+        Wrap an existing DataFrame in a reader, bypassing file I/O.
+
+        For callers (and tests) that already hold the data in memory:
+        get_columns()/get_data()/get_row_count() work immediately without
+        paying an Excel write/parse round-trip.
+
+        Args:
+            data_frame: DataFrame to expose through the reader interface
+
+        Returns:
+            ExcelReader with the DataFrame pre-loaded
+        """
+        reader = cls(file_path='<in-memory>')
+        reader.data_frame = data_frame
+        return reader
+
+
+    def load(self, sheet_name: Optional[str] = None, header_row: Optional[int] = 0,
+             dtype: Optional[Dict[str, Any]] = None, parse_dates: Optional[List[str]] = None) -> pd.DataFrame:
         """
         Load Excel file into a pandas DataFrame.
-        
+
         Args:
             sheet_name: Name of the sheet to load (default: first sheet)
-            
+            dtype: Optional column->dtype mapping; skips pandas' per-column
+                type inference pass when the caller already knows the types
+            parse_dates: Optional list of columns to parse as dates
+
         Returns:
             DataFrame containing the Excel data
         """
         try:
-            # pandas read_excel header parameter expects row index (0-based).
-            # header_row is 0-based here; pass through to pandas so users can
-            # choose which row contains column names (e.g. header_row=1 -> second row).
-            if sheet_name:
-                self.data_frame = pd.read_excel(self.file_path, sheet_name=sheet_name, header=header_row)
+            # Explicit dtype/parse_dates change the parse, so those loads
+            # bypass both the in-process memo and the Feather cache; the
+            # cache keys don't carry the parse arguments
+            cacheable = dtype is None and parse_dates is None
+            mem_key = None
+            if cacheable:
+                mem_key = (os.path.abspath(self.file_path),
+                           os.stat(self.file_path).st_mtime_ns,
+                           sheet_name, header_row)
+                hit = _LOAD_CACHE.get(mem_key)
+                if hit is not None:
+                    # Shallow copy: shares the column data but not the
+                    # axes, so callers renaming columns can't poison it
+                    self.data_frame = hit.copy(deep=False)
+                    return self.data_frame
+
+                # Transparent on-disk cache: keyed on file path, mtime,
+                # sheet and header row, so a stale cache is never served
+                # for an edited file.
+                cache_path = self._cache_path(sheet_name, header_row)
+                cached = self._read_cache(cache_path)
+                if cached is not None:
+                    self.data_frame = cached
+                    self._memoize(mem_key, cached)
+                    return self.data_frame
+
+            # Explicit dtypes/date columns short-circuit the post-parse
+            # type-inference sweep in the pandas-based engines
+            read_kwargs = dict(READ_EXCEL_KWARGS)
+            if dtype is not None:
+                read_kwargs['dtype'] = dtype
+            if parse_dates is not None:
+                read_kwargs['parse_dates'] = parse_dates
+
+            # Fastest path: the Rust-based calamine engine, if installed.
+            # It parses the XLSX in native code and is roughly an order of
+            # magnitude faster than openpyxl on large sheets.
+            calamine = self._load_calamine(sheet_name, header_row, read_kwargs)
+            if calamine is not None:
+                self.data_frame = calamine
+            # Fast path for .xlsx: stream rows with openpyxl in read-only mode.
+            # This skips the styles/merged-cells/formula parsing that a full
+            # workbook load performs and is dramatically faster on large files.
+            # The streaming parser has no dtype/parse_dates hooks, so loads
+            # with explicit arguments fall through to pd.read_excel instead.
+            elif str(self.file_path).lower().endswith('.xlsx') \
+                    and dtype is None and parse_dates is None:
+                self.data_frame = self._load_read_only(sheet_name, header_row)
             else:
-                self.data_frame = pd.read_excel(self.file_path, header=header_row)
+                # pandas read_excel header parameter expects row index (0-based).
+                # header_row is 0-based here; pass through to pandas so users can
+                # choose which row contains column names (e.g. header_row=1 -> second row).
+                if sheet_name:
+                    self.data_frame = pd.read_excel(
+                        self.file_path, sheet_name=sheet_name, header=header_row, **read_kwargs
+                    )
+                else:
+                    self.data_frame = pd.read_excel(self.file_path, header=header_row, **read_kwargs)
+            self.data_frame = self._normalize_strings(self.data_frame)
+            if cacheable:
+                self._write_cache(cache_path, self.data_frame)
+                self._memoize(mem_key, self.data_frame)
             return self.data_frame
         except Exception as e:
             raise Exception(f"Error loading Excel file: {str(e)}")
+
+    @staticmethod
+    def _memoize(mem_key: Optional[tuple], data_frame: pd.DataFrame) -> None:
+        """Store a shallow copy in the in-process load memo, if keyed."""
+        if mem_key is None:
+            return
+        if len(_LOAD_CACHE) >= _LOAD_CACHE_MAX:
+            _LOAD_CACHE.pop(next(iter(_LOAD_CACHE)))
+        _LOAD_CACHE[mem_key] = data_frame.copy(deep=False)
+
+    def _load_calamine(self, sheet_name: Optional[str], header_row: Optional[int],
+                       read_kwargs: Optional[Dict[str, Any]] = None) -> Optional[pd.DataFrame]:
+        """
+        Load via pandas' calamine engine, or None if python-calamine is not installed.
+
+        Args:
+            sheet_name: Name of the sheet to load (default: first sheet)
+            header_row: 0-based index of the row containing column names
+            read_kwargs: Extra keyword arguments for pd.read_excel
+
+        Returns:
+            DataFrame containing the sheet data, or None if unavailable
+        """
+        if read_kwargs is None:
+            read_kwargs = READ_EXCEL_KWARGS
+        try:
+            if sheet_name:
+                return pd.read_excel(
+                    self.file_path, sheet_name=sheet_name, header=header_row,
+                    engine='calamine', **read_kwargs
+                )
+            return pd.read_excel(self.file_path, header=header_row, engine='calamine', **read_kwargs)
+        except ImportError:
+            # python-calamine is an optional dependency; fall back to openpyxl
+            return None
+
+    def _normalize_strings(self, data_frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert low-cardinality string columns to Categorical dtype.
+
+        Columns like status flags repeat a handful of values; as Categorical
+        they are stored as small integer codes, so equality scans in rule
+        validation compare integers instead of string objects.
+
+        Args:
+            data_frame: Freshly loaded DataFrame
+
+        Returns:
+            DataFrame with eligible columns converted in place
+        """
+        if len(data_frame) == 0:
+            return data_frame
+        for col in data_frame.columns:
+            series = data_frame[col]
+            try:
+                if (series.dtype == object or pd.api.types.is_string_dtype(series)) \
+                        and series.nunique(dropna=True) / len(series) < 0.5:
+                    data_frame[col] = series.astype('category')
+            except TypeError:
+                # Mixed/unhashable values can't be categorized; leave as-is
+                continue
+        return data_frame
+
+    def _cache_path(self, sheet_name: Optional[str], header_row: Optional[int]) -> Path:
+        """Compute the cache file path for the current (path, mtime, sheet, header)."""
+        key = hashlib.sha1(
+            f"{self.file_path}|{os.path.getmtime(self.file_path)}|{sheet_name}|{header_row}".encode()
+        ).hexdigest()
+        return CACHE_DIR / f"{key}.feather"
+
+    def _read_cache(self, cache_path: Path) -> Optional[pd.DataFrame]:
+        """Read a cached DataFrame, or None if absent/unreadable."""
+        try:
+            if cache_path.exists():
+                return pd.read_feather(cache_path)
+        except Exception:
+            # Corrupt cache or missing pyarrow; fall back to a full parse
+            pass
+        return None
+
+    def _write_cache(self, cache_path: Path, data_frame: pd.DataFrame) -> None:
+        """Write the DataFrame to the Feather cache; failures are non-fatal."""
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            data_frame.reset_index(drop=True).to_feather(cache_path)
+        except Exception:
+            # Caching is best-effort (e.g. pyarrow unavailable, read-only home)
+            pass
+
+    def _load_read_only(self, sheet_name: Optional[str], header_row: Optional[int]) -> pd.DataFrame:
+        """
+        Stream an .xlsx sheet into a DataFrame using openpyxl read-only mode.
+
+        Args:
+            sheet_name: Name of the sheet to load (default: first sheet)
+            header_row: 0-based index of the row containing column names
+
+        Returns:
+            DataFrame containing the sheet data
+        """
+        # keep_links=False skips parsing xl/externalLinks/*.xml entirely
+        wb = openpyxl.load_workbook(
+            self.file_path, read_only=True, data_only=True, keep_links=False
+        )
+        try:
+            ws = wb[sheet_name] if sheet_name else wb.worksheets[0]
+            rows = ws.iter_rows(values_only=True)
+
+            # Skip rows above the header, then capture the header row
+            header = None
+            skip = header_row if header_row else 0
+            for i, row in enumerate(rows):
+                if i == skip:
+                    header = row
+                    break
+            if header is None:
+                return pd.DataFrame()
+
+            columns = self._header_columns(header)
+            return self._frame_from_rows(columns, rows)
+        finally:
+            wb.close()
+
+    @staticmethod
+    def dedup_columns(columns: List[Any]) -> List[Any]:
+        """
+        Suffix duplicate column names pandas-style (col, col1, col2, ...).
+
+        Occurrence counting runs as one groupby/cumcount pass in C; the
+        Python-level rename then touches only the duplicate positions, so
+        unique non-string names pass through unchanged.
+
+        Args:
+            columns: Column names in sheet order
+
+        Returns:
+            List of the same length with duplicates uniquely suffixed
+        """
+        series = pd.Series(columns)
+        occurrence = series.groupby(series, sort=False).cumcount().tolist()
+        result = list(columns)
+        for i, occ in enumerate(occurrence):
+            if occ:
+                result[i] = f"{result[i]}{occ}"
+        return result
+
+    @staticmethod
+    def _header_columns(header: tuple) -> List[str]:
+        """Turn a raw header row into pandas-style column names."""
+        columns = [
+            str(cell) if cell is not None else f"Unnamed: {i}"
+            for i, cell in enumerate(header)
+        ]
+        # Duplicate names must be suffixed here: _frame_from_rows keys its
+        # column dict by name, so repeats would silently drop data
+        return ExcelReader.dedup_columns(columns)
+
+    @staticmethod
+    def _frame_from_rows(columns: List[str], rows) -> pd.DataFrame:
+        """Build a DataFrame from an iterable of value tuples, column-wise."""
+        column_data: List[List[Any]] = [[] for _ in columns]
+        num_cols = len(columns)
+        for row in rows:
+            for j in range(num_cols):
+                column_data[j].append(row[j] if j < len(row) else None)
+        return pd.DataFrame(dict(zip(columns, column_data)), columns=columns)
+
+    def iter_chunks(self, sheet_name: Optional[str] = None, header_row: Optional[int] = 0,
+                    chunk_size: int = 50000):
+        """
+        Stream the sheet as successive DataFrames of up to chunk_size rows.
+
+        Lets callers process workbooks far larger than memory: only one
+        chunk of rows is materialized at a time, read through openpyxl's
+        read-only streaming parser.
+
+        Args:
+            sheet_name: Name of the sheet to read (default: first sheet)
+            header_row: 0-based index of the row containing column names
+            chunk_size: Maximum number of data rows per yielded DataFrame
+
+        Yields:
+            DataFrame chunks in sheet order
+        """
+        # keep_links=False skips parsing xl/externalLinks/*.xml entirely
+        wb = openpyxl.load_workbook(
+            self.file_path, read_only=True, data_only=True, keep_links=False
+        )
+        try:
+            ws = wb[sheet_name] if sheet_name else wb.worksheets[0]
+            rows = ws.iter_rows(values_only=True)
+
+            header = None
+            skip = header_row if header_row else 0
+            for i, row in enumerate(rows):
+                if i == skip:
+                    header = row
+                    break
+            if header is None:
+                return
+
+            columns = self._header_columns(header)
+            buffer = []
+            for row in rows:
+                buffer.append(row)
+                if len(buffer) >= chunk_size:
+                    yield self._frame_from_rows(columns, buffer)
+                    buffer = []
+            if buffer:
+                yield self._frame_from_rows(columns, buffer)
+        finally:
+            wb.close()
+
+    def load_preview(self, sheet_name: Optional[str] = None, header_row: Optional[int] = 0,
+                     nrows: int = 100) -> pd.DataFrame:
+        """
+        Load just the first nrows of the sheet, for fast UI previews.
+
+        Args:
+            sheet_name: Name of the sheet to load (default: first sheet)
+            header_row: 0-based index of the row containing column names
+            nrows: Maximum number of data rows to read
+
+        Returns:
+            DataFrame containing at most nrows rows
+        """
+        try:
+            try:
+                if sheet_name:
+                    return pd.read_excel(
+                        self.file_path, sheet_name=sheet_name, header=header_row,
+                        nrows=nrows, engine='calamine', **READ_EXCEL_KWARGS
+                    )
+                return pd.read_excel(
+                    self.file_path, header=header_row, nrows=nrows,
+                    engine='calamine', **READ_EXCEL_KWARGS
+                )
+            except ImportError:
+                pass
+            for chunk in self.iter_chunks(sheet_name, header_row, chunk_size=nrows):
+                return chunk
+            return pd.DataFrame()
+        except Exception as e:
+            raise Exception(f"Error loading Excel file: {str(e)}")
     
     def get_columns(self) -> List[str]:
         """
@@ -86,7 +434,24 @@ class ExcelReader:
             List of sheet names
         """
         try:
-            wb = openpyxl.load_workbook(self.file_path, read_only=True)
+            # An .xlsx file is a ZIP archive; the sheet names live in
+            # xl/workbook.xml. Reading that one member directly avoids
+            # opening the whole workbook just to enumerate sheets.
+            try:
+                with zipfile.ZipFile(self.file_path) as zf:
+                    root = ET.fromstring(zf.read('xl/workbook.xml'))
+                sheet_names = [
+                    element.get('name')
+                    for element in root.iter()
+                    if element.tag.endswith('}sheet') or element.tag == 'sheet'
+                ]
+                if sheet_names:
+                    return sheet_names
+            except (zipfile.BadZipFile, KeyError, ET.ParseError):
+                # Not a standard .xlsx archive; fall back to openpyxl
+                pass
+
+            wb = openpyxl.load_workbook(self.file_path, read_only=True, keep_links=False)
             sheet_names = wb.sheetnames
             wb.close()
             return sheet_names
@@ -4,31 +4,47 @@ Provides a Windows GUI for Excel file validation with natural language rules.
 """
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
-import pandas as pd
-from typing import List, Optional
+from typing import List, Optional, Tuple, TYPE_CHECKING
+import atexit
 import os
 import sys
 import logging
+import logging.handlers
+import queue
+import threading
 import traceback
 from datetime import datetime
 
-from excel_reader import ExcelReader
 from rule_parser import RuleParser, Rule
-from rule_engine import RuleEngine, ValidationResult
 
-# Setup logging to file with timestamped filename and also stream to stdout
+# pandas, openpyxl and the engine are imported lazily (in load_data /
+# validate_data) so the window appears without paying their import cost.
+if TYPE_CHECKING:
+    import pandas as pd
+    from excel_reader import ExcelReader
+    from rule_engine import RuleEngine
+
+# Setup logging to file with timestamped filename and also stream to stdout.
+# Records pass through a queue drained by a background listener thread, so
+# logger.exception calls in the Tk event loop never block on disk writes.
 LOG_DIR = os.path.join(os.path.dirname(__file__), "logs")
 os.makedirs(LOG_DIR, exist_ok=True)
 _TS = datetime.now().strftime("%Y%m%d_%H%M%S")
 LOG_FILE = os.path.join(LOG_DIR, f"gui_{_TS}.log")
+_log_queue = queue.Queue(-1)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s %(levelname)s: %(message)s',
-    handlers=[
-        logging.FileHandler(LOG_FILE, encoding='utf-8'),
-        logging.StreamHandler(sys.stdout)
-    ]
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
+)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.FileHandler(LOG_FILE, encoding='utf-8'),
+    logging.StreamHandler(sys.stdout)
 )
+_log_listener.start()
+# Flush queued records through the real handlers at interpreter exit
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
 
@@ -70,7 +86,7 @@ class ExcelRuleValidationApp:
         h = self.root.winfo_height()
         if w <= 1 and h <= 1:
             # geometry not yet applied; use requested size
-            geom = self.root.winfo_geometry().split('+')[0]
+            geom = self.root.winfo_geometry().partition('+')[0]
             try:
                 w, h = map(int, geom.split('x'))
             except Exception:
@@ -82,11 +98,30 @@ class ExcelRuleValidationApp:
         self.root.geometry(f"{w}x{h}+{x}+{y}")
         
         # Data storage
-        self.excel_reader: Optional[ExcelReader] = None
-        self.data: Optional[pd.DataFrame] = None
+        self.excel_reader: Optional["ExcelReader"] = None
+        self.data: Optional["pd.DataFrame"] = None
+        self._columns: Tuple[str, ...] = ()
+        # Column name -> NumPy array, materialized once per load so each
+        # validation run skips the per-column pandas label lookups
+        self._col_arrays = {}
+        # Auto-detected header rows keyed on (path, mtime): repeated loads
+        # of the same file skip the sniffing pass entirely
+        self._header_cache = {}
+        # True while a load worker is in flight; load_data and
+        # validate_data refuse to run so validation can never see a
+        # half-replaced data/_col_arrays pair
+        self._loading = False
         self.rules: List[Rule] = []
+        # Rule name -> position in self.rules; avoids linear scans on
+        # select/edit/remove when many rules are loaded
+        self._rule_index = {}
+        # Names kept as a parallel list so combo refreshes hand Tk the
+        # ready-made sequence instead of walking every Rule object
+        self._rule_names: List[str] = []
+        # Pending after() id for the debounced rule preview render
+        self._preview_job = None
         self.rule_parser = RuleParser()
-        self.rule_engine = RuleEngine()
+        self.rule_engine: Optional["RuleEngine"] = None
         
         # Setup UI
         self.setup_ui()
@@ -204,6 +239,10 @@ class ExcelRuleValidationApp:
         hdr_spin.grid(row=1, column=1, sticky=tk.W, padx=5, pady=(6,0))
         self.auto_header_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(file_frame, text='Auto-detect header', variable=self.auto_header_var).grid(row=1, column=2, sticky=tk.W, padx=5, pady=(6,0))
+
+        # Indeterminate progress indicator shown while a load runs on the worker thread
+        self.load_progress = ttk.Progressbar(file_frame, mode='indeterminate', length=120)
+        self.load_progress.grid(row=1, column=3, sticky=tk.W, padx=5, pady=(6,0))
         
     def create_rule_section(self, parent):
         """Create rule input section."""
@@ -306,6 +345,11 @@ class ExcelRuleValidationApp:
         hsb.grid(row=1, column=0, sticky=(tk.W, tk.E))
         self.data_tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
 
+        # Preview state for incremental updates on re-load
+        self._preview_columns = None
+        self._preview_iids = []
+        self._columns_deduped = False
+
     def create_examples_section(self, parent):
         """Create examples tab with many sample expressions (double-click to insert)."""
         frame = ttk.LabelFrame(parent, text="Sample Expressions", padding="6")
@@ -347,8 +391,9 @@ class ExcelRuleValidationApp:
             "((A > 10 AND B < 5) OR (C = 'x' AND (D > 0 OR (E < 0 AND F != 'Z'))))",
         ]
 
-        for ex in examples:
-            self.examples_list.insert(tk.END, ex)
+        # One insert call for the whole batch: a single Tcl round-trip and
+        # layout pass instead of one per example
+        self.examples_list.insert(tk.END, *examples)
 
         # allow double-click to insert into rule entry
         self.examples_list.bind('<Double-1>', self.insert_example)
@@ -367,21 +412,62 @@ class ExcelRuleValidationApp:
         except Exception:
             logger.exception('Failed to attach examples context menu')
 
-    def detect_header_row(self, file_path, max_rows=10):
+    def detect_header_row(self, file_path, max_rows=10, max_cols=50):
         """Attempt to auto-detect which row contains headers.
 
+        Only the first max_cols columns are sniffed: the most-non-nulls
+        heuristic converges well before that, and on wide sheets it keeps
+        the sniff from parsing thousands of cells it will never look at.
+
         Returns 0-based header row index or 0 if detection fails.
         """
         try:
-            df = pd.read_excel(file_path, header=None, nrows=max_rows)
-            # choose the row with maximum non-null values
-            best_idx = 0
-            best_count = -1
-            for i in range(min(len(df), max_rows)):
-                count = df.iloc[i].count()
-                if count > best_count:
-                    best_count = count
-                    best_idx = i
+            cache_key = (file_path, os.path.getmtime(file_path))
+            if cache_key in self._header_cache:
+                return self._header_cache[cache_key]
+            try:
+                # Same engine preference as ExcelReader.load: calamine parses
+                # in native code, an order of magnitude faster than openpyxl
+                import pandas as pd
+                try:
+                    df = pd.read_excel(
+                        file_path, header=None, nrows=max_rows,
+                        usecols=range(max_cols), engine='calamine'
+                    )
+                except pd.errors.ParserError:
+                    # Sheet is narrower than the sniff window; out-of-bounds
+                    # usecols raises, so reread the few rows unrestricted
+                    df = pd.read_excel(
+                        file_path, header=None, nrows=max_rows, engine='calamine'
+                    )
+            except ImportError:
+                # openpyxl fallback: read-only mode streams just the sniffed
+                # rows without styles/formulas or the workbook DOM, and no
+                # pandas frame is needed to count cells
+                import itertools
+                import openpyxl
+                wb = openpyxl.load_workbook(
+                    file_path, read_only=True, data_only=True, keep_links=False
+                )
+                try:
+                    rows = list(itertools.islice(wb.active.iter_rows(values_only=True), max_rows))
+                finally:
+                    wb.close()
+                best_idx = 0
+                best_count = -1
+                for i, row in enumerate(rows):
+                    count = sum(value is not None for value in row[:max_cols])
+                    if count > best_count:
+                        best_count = count
+                        best_idx = i
+                self._header_cache[cache_key] = int(best_idx)
+                return int(best_idx)
+
+            # choose the row with maximum non-null values; one vectorized
+            # pass over the sniff matrix instead of a Series per row
+            # (argmax keeps the first row on ties, like the old loop)
+            best_idx = 0 if df.empty else int(df.notna().sum(axis=1).to_numpy().argmax())
+            self._header_cache[cache_key] = int(best_idx)
             return int(best_idx)
         except Exception:
             logger.exception('Auto-detect header failed')
@@ -396,12 +482,29 @@ class ExcelRuleValidationApp:
         results_frame.rowconfigure(0, weight=1)
         
         self.results_text = scrolledtext.ScrolledText(
-            results_frame, 
-            height=10, 
+            results_frame,
+            height=10,
             wrap=tk.WORD,
             font=('Consolas', 9)
         )
         self.results_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        # Tracks whether the widget holds text, so empty->empty updates skip
+        # the full-refresh that Text.delete triggers
+        self._results_dirty = False
+
+    def _set_results_text(self, report: str):
+        """Replace the results text, chunking large reports to stay responsive."""
+        if self._results_dirty:
+            self.results_text.delete(1.0, tk.END)
+        # 64KB chunks keep the event loop serviced on very large reports
+        chunk_size = 64 * 1024
+        chunked = len(report) > chunk_size
+        for start in range(0, len(report), chunk_size):
+            self.results_text.insert(tk.END, report[start:start + chunk_size])
+            if chunked:
+                self.results_text.update_idletasks()
+        self.results_text.see('1.0')
+        self._results_dirty = bool(report)
         
     def create_control_section(self, parent):
         """Create control buttons section."""
@@ -439,67 +542,142 @@ class ExcelRuleValidationApp:
             self.status_var.set(f"Selected: {os.path.basename(filename)}")
             
     def load_data(self):
-        """Load Excel data."""
+        """Load Excel data on a worker thread so the UI stays responsive."""
         file_path = self.file_path_var.get()
         if not file_path:
             messagebox.showwarning("Warning", "Please select an Excel file first.")
             return
-        
+
+        if self._loading:
+            messagebox.showwarning("Warning", "A file is already loading. Please wait.")
+            return
+
+        # Read the Tk variables on the main thread; the worker must not
+        # touch them. Plain hasattr checks rather than getattr defaults:
+        # getattr would allocate a throwaway Tcl variable on every click
+        auto_header = hasattr(self, 'auto_header_var') and self.auto_header_var.get()
+        # header_row_var is 1-based for the user; convert to 0-based for pandas
+        hdr = int(self.header_row_var.get()) - 1 if hasattr(self, 'header_row_var') else 1
+
+        self.status_var.set(f"Loading {os.path.basename(file_path)}...")
+        self._loading = True
+        self.load_progress.start(50)
+        threading.Thread(
+            target=self._load_worker, args=(file_path, hdr, auto_header), daemon=True
+        ).start()
+
+    def _load_worker(self, file_path, hdr, auto_header):
+        """Worker-thread body for load_data; must not touch any widget."""
         try:
-            self.excel_reader = ExcelReader(file_path)
-            # header_row_var is 1-based for the user; convert to 0-based for pandas
-            if getattr(self, 'auto_header_var', tk.BooleanVar(value=False)).get():
+            from excel_reader import ExcelReader
+            reader = ExcelReader(file_path)
+            if auto_header:
                 hdr = self.detect_header_row(file_path)
-            else:
-                hdr = int(getattr(self, 'header_row_var', tk.IntVar(value=2)).get()) - 1
-            self.data = self.excel_reader.load(header_row=hdr)
-            
-            self.display_data_preview()
-            self.status_var.set(f"Loaded {len(self.data)} rows from {os.path.basename(file_path)}")
-            messagebox.showinfo("Success", f"Loaded {len(self.data)} rows successfully!")
-            
+            # Show the first rows immediately; the full parse continues below
+            try:
+                preview = reader.load_preview(header_row=hdr)
+                self.root.after(0, lambda: self._show_preview(preview))
+            except Exception:
+                logger.exception("Preview load failed for %s", file_path)
+            data = reader.load(header_row=hdr)
+            error = None
         except Exception as e:
             logger.exception("Failed to load Excel file: %s", file_path)
-            messagebox.showerror("Error", f"Failed to load Excel file:\n{str(e)}")
+            reader = None
+            data = None
+            error = str(e)
+        # Hand the result back to the Tk main thread
+        self.root.after(0, lambda: self._finalize_load(file_path, reader, data, error))
+
+    def _show_preview(self, preview):
+        """Main-thread callback: display the quick preview while loading continues."""
+        self.data = preview
+        # The cached arrays still describe the previous file; drop them so
+        # nothing can validate against them while the new load completes
+        self._columns = ()
+        self._col_arrays = {}
+        self._columns_deduped = False
+        self.display_data_preview()
+        self.status_var.set("Previewing first rows; full load in progress...")
+
+    def _finalize_load(self, file_path, reader, data, error):
+        """Main-thread finalizer: publish the loaded data and update widgets."""
+        self._loading = False
+        self.load_progress.stop()
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to load Excel file:\n{error}")
             self.status_var.set("Error loading file")
+            return
+
+        self.excel_reader = reader
+        self.data = data
+        self._columns_deduped = False
+
+        self.display_data_preview()
+        # Cache the (possibly deduplicated) columns once per load; a tuple
+        # so every parse_rule call can share it without re-materializing
+        self._columns = tuple(self.data.columns)
+        self._col_arrays = {col: self.data[col].to_numpy() for col in self._columns}
+        self.status_var.set(f"Loaded {len(self.data)} rows from {os.path.basename(file_path)}")
+        messagebox.showinfo("Success", f"Loaded {len(self.data)} rows successfully!")
             
     def display_data_preview(self):
         """Display data in the preview tree."""
-        # Clear existing data
-        self.data_tree.delete(*self.data_tree.get_children())
-        
         if self.data is None or self.data.empty:
+            self.data_tree.delete(*self.data_tree.get_children())
+            self._preview_iids = []
             return
         
-        # Configure columns, ensuring duplicate names are suffixed
-        orig_columns = list(self.data.columns)
-        counts = {}
-        new_columns = []
-        for col in orig_columns:
-            if col not in counts:
-                counts[col] = 0
-                new_columns.append(col)
-            else:
-                counts[col] += 1
-                new_columns.append(f"{col}{counts[col]}")
-        # apply unique column names back to dataframe
+        # Configure columns, ensuring duplicate names are suffixed. This only
+        # needs to happen once per loaded DataFrame, and the column reassign
+        # (an O(n) pandas operation) only when duplicates actually exist.
+        if self._columns_deduped:
+            columns = list(self.data.columns)
+        else:
+            from excel_reader import ExcelReader
+            orig_columns = list(self.data.columns)
+            new_columns = ExcelReader.dedup_columns(orig_columns)
+            if new_columns != orig_columns:
+                # apply unique column names back to dataframe
+                try:
+                    self.data.columns = new_columns
+                except Exception:
+                    logger.exception('Failed to set unique column names')
+            self._columns_deduped = True
+            columns = new_columns
+
+        # Reconfigure headings only when the column set actually changed;
+        # otherwise existing rows can be updated in place below
+        if self._preview_columns != columns:
+            self.data_tree.delete(*self.data_tree.get_children())
+            self._preview_iids = []
+            self.data_tree['columns'] = columns
+            self.data_tree['show'] = 'headings'
+            for col in columns:
+                self.data_tree.heading(col, text=col)
+                self.data_tree.column(col, width=100, minwidth=50)
+            self._preview_columns = columns
+
+        # Add data (first 100 rows for preview). astype(str) stringifies all
+        # cells in one vectorized pass instead of a Python str() per cell.
+        # Existing rows are updated in place, only the delta is inserted and
+        # only the surplus deleted, and the tree is unmapped while updating
+        # so Tk doesn't schedule a relayout per row.
+        value_rows = [tuple(row) for row in self.data.head(100).astype(str).to_numpy()]
+        iids = self._preview_iids
+        self.data_tree.grid_remove()
         try:
-            self.data.columns = new_columns
-        except Exception:
-            logger.exception('Failed to set unique column names')
-        columns = new_columns
-        self.data_tree['columns'] = columns
-        self.data_tree['show'] = 'headings'
-        
-        # Set column headings
-        for col in columns:
-            self.data_tree.heading(col, text=col)
-            self.data_tree.column(col, width=100, minwidth=50)
-        
-        # Add data (first 100 rows for preview)
-        for index, row in self.data.head(100).iterrows():
-            values = [str(val) for val in row.tolist()]
-            self.data_tree.insert('', tk.END, values=values)
+            reused = min(len(iids), len(value_rows))
+            for i in range(reused):
+                self.data_tree.item(iids[i], values=value_rows[i])
+            for values in value_rows[reused:]:
+                iids.append(self.data_tree.insert('', tk.END, values=values))
+            if len(iids) > len(value_rows):
+                surplus = iids[len(value_rows):]
+                del iids[len(value_rows):]
+                self.data_tree.delete(*surplus)
+        finally:
+            self.data_tree.grid()
         
         # Populate column combobox for rule insertion (if present)
         try:
@@ -522,12 +700,14 @@ class ExcelRuleValidationApp:
             return
         
         try:
-            columns = self.data.columns.tolist()
+            columns = self._columns
             # Auto-generate rule name from expression
             rule_name = f"Rule{len(self.rules) + 1}"
             rule = self.rule_parser.parse_rule(rule_text, columns, rule_name=rule_name)
             self.rules.append(rule)
-            
+            self._rule_index[rule.name] = len(self.rules) - 1
+            self._rule_names.append(rule.name)
+
             # Add to rules tree (show enabled, name, expression)
             display_text = f"{rule.name}: {rule_text}"
             enabled_text = 'Yes' if getattr(rule, 'enabled', True) else 'No'
@@ -535,10 +715,9 @@ class ExcelRuleValidationApp:
             # Update rules dropdown (for easy insertion into expressions)
             try:
                 if hasattr(self, 'rule_combo'):
-                    vals = [r.name for r in self.rules]
-                    self.rule_combo['values'] = vals
-                    if vals:
-                        self.rule_combo.current(len(vals)-1)
+                    self.rule_combo['values'] = self._rule_names
+                    if self._rule_names:
+                        self.rule_combo.current(len(self._rule_names)-1)
             except Exception:
                 logger.exception('Failed to update rule combo')
             
@@ -564,17 +743,20 @@ class ExcelRuleValidationApp:
         rule_name = vals[1] if len(vals) > 1 else None
         if rule_name:
             # Find rule index by name
-            idx = next((i for i, r in enumerate(self.rules) if r.name == rule_name), None)
+            idx = self._rule_index.pop(rule_name, None)
             if idx is not None:
                 del self.rules[idx]
+                del self._rule_names[idx]
+                # Only entries behind the removed rule shifted position
+                for i in range(idx, len(self.rules)):
+                    self._rule_index[self.rules[i].name] = i
         self.rules_tree.delete(item)
         self.status_var.set("Rule removed")
         # refresh rule combo
         try:
             if hasattr(self, 'rule_combo'):
-                vals = [r.name for r in self.rules]
-                self.rule_combo['values'] = vals
-                if vals:
+                self.rule_combo['values'] = self._rule_names
+                if self._rule_names:
                     self.rule_combo.current(0)
         except Exception:
             logger.exception('Failed to refresh rule combo after removal')
@@ -590,7 +772,7 @@ class ExcelRuleValidationApp:
         vals = self.rules_tree.item(item, 'values')
         rule_name = vals[1] if len(vals) > 1 else None
         orig_text = vals[2] if len(vals) > 2 else ''
-        idx = next((i for i, r in enumerate(self.rules) if r.name == rule_name), None)
+        idx = self._rule_index.get(rule_name)
         orig_rule = self.rules[idx] if idx is not None else None
 
         # Create modal dialog
@@ -611,7 +793,7 @@ class ExcelRuleValidationApp:
                 return
             try:
                 # Re-parse the rule using the same rule name to validate/update
-                columns = self.data.columns.tolist() if self.data is not None else []
+                columns = self._columns if self.data is not None else []
                 new_rule = self.rule_parser.parse_rule(new_text, columns, rule_name=rule_name)
                 # replace in our rules list if index known
                 if idx is not None:
@@ -622,8 +804,7 @@ class ExcelRuleValidationApp:
                 # refresh rule combo
                 try:
                     if hasattr(self, 'rule_combo'):
-                        vals = [r.name for r in self.rules]
-                        self.rule_combo['values'] = vals
+                        self.rule_combo['values'] = self._rule_names
                 except Exception:
                     logger.exception('Failed to refresh rule combo after edit')
                 self.status_var.set(f"Updated rule: {new_rule.name}")
@@ -789,6 +970,8 @@ class ExcelRuleValidationApp:
             if resp:
                 # clear existing
                 self.rules.clear()
+                self._rule_index.clear()
+                self._rule_names.clear()
                 for iid in list(self.rules_tree.get_children()):
                     self.rules_tree.delete(iid)
                 self.rule_parser.rules.clear()
@@ -801,6 +984,8 @@ class ExcelRuleValidationApp:
                 self.rule_parser.rules.append(rule)
                 self.rule_parser.rules_by_name[rule.name] = rule
                 self.rules.append(rule)
+                self._rule_index[rule.name] = len(self.rules) - 1
+                self._rule_names.append(rule.name)
                 enabled_text = 'Yes' if getattr(rule, 'enabled', True) else 'No'
                 self.rules_tree.insert('', tk.END, values=(enabled_text, rule.name, rule.description or ''))
                 count += 1
@@ -808,8 +993,7 @@ class ExcelRuleValidationApp:
             # refresh rule combobox
             try:
                 if hasattr(self, 'rule_combo'):
-                    vals = [r.name for r in self.rules]
-                    self.rule_combo['values'] = vals
+                    self.rule_combo['values'] = self._rule_names
             except Exception:
                 logger.exception('Failed to refresh rule combo after load')
 
@@ -854,7 +1038,18 @@ class ExcelRuleValidationApp:
             messagebox.showerror('Error', 'Failed to disable all rules')
         
     def on_rule_select(self, event):
+        """Debounced <<TreeviewSelect>> handler for the rule preview.
+
+        Arrow-key navigation fires one selection event per step; bursts
+        are coalesced into a single render shortly after the last event.
+        """
+        if self._preview_job is not None:
+            self.root.after_cancel(self._preview_job)
+        self._preview_job = self.root.after(60, self._render_rule_preview)
+
+    def _render_rule_preview(self):
         """Display a small preview of the parsed conditions for the selected rule."""
+        self._preview_job = None
         try:
             selection = self.rules_tree.selection()
             if not selection:
@@ -867,7 +1062,8 @@ class ExcelRuleValidationApp:
             item = selection[0]
             vals = self.rules_tree.item(item, 'values')
             rule_name = vals[1] if len(vals) > 1 else None
-            rule = next((r for r in self.rules if r.name == rule_name), None)
+            idx = self._rule_index.get(rule_name)
+            rule = self.rules[idx] if idx is not None else None
             self.rule_preview.config(state='normal')
             self.rule_preview.delete(1.0, tk.END)
             if rule:
@@ -897,7 +1093,7 @@ class ExcelRuleValidationApp:
             if not rule_name:
                 return
             # find rule
-            idx = next((i for i, r in enumerate(self.rules) if r.name == rule_name), None)
+            idx = self._rule_index.get(rule_name)
             if idx is None:
                 return
             rule = self.rules[idx]
@@ -914,6 +1110,10 @@ class ExcelRuleValidationApp:
         
     def validate_data(self):
         """Validate data using defined rules."""
+        if self._loading:
+            messagebox.showwarning("Warning", "A file is still loading. Please wait.")
+            return
+
         if self.data is None:
             messagebox.showwarning("Warning", "Please load data first.")
             return
@@ -923,14 +1123,20 @@ class ExcelRuleValidationApp:
             return
         
         try:
-            # Run validation on enabled rules only
+            if self.rule_engine is None:
+                from rule_engine import RuleEngine
+                self.rule_engine = RuleEngine()
+            # Run validation on enabled rules only, handing the engine
+            # contiguous column arrays for vectorized mask evaluation
             enabled_rules = [r for r in self.rules if getattr(r, 'enabled', True)]
-            results = self.rule_engine.validate(self.data, enabled_rules)
+            # Rebuild from the displayed frame itself if the cache is
+            # empty (e.g. after a failed load left only the preview)
+            col_arrays = self._col_arrays or {col: self.data[col].to_numpy() for col in self.data.columns}
+            results = self.rule_engine.validate_vectorized(col_arrays, enabled_rules)
             
             # Display results
             report = self.rule_engine.generate_report()
-            self.results_text.delete(1.0, tk.END)
-            self.results_text.insert(1.0, report)
+            self._set_results_text(report)
             
             # Update status
             passed = len(self.rule_engine.get_passed_validations())
@@ -948,12 +1154,14 @@ class ExcelRuleValidationApp:
             
     def clear_results(self):
         """Clear validation results."""
-        self.results_text.delete(1.0, tk.END)
+        if self._results_dirty:
+            self.results_text.delete(1.0, tk.END)
+            self._results_dirty = False
         self.status_var.set("Results cleared")
         
     def export_results(self):
         """Export validation results to a file."""
-        if not self.rule_engine.results:
+        if self.rule_engine is None or not self.rule_engine.results:
             messagebox.showwarning("Warning", "No results to export.")
             return
         
@@ -2,13 +2,49 @@
 Rule Engine Module
 Executes parsed rules against data and generates validation results.
 """
+import operator
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pandas as pd
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from rule_parser import Rule, Condition, ConditionType, LogicalOperator, RuleReference
 
+# pyarrow's compute kernels run substring searches in native code over
+# contiguous string buffers, far faster than pandas' per-element object
+# loop. Used only for columns Arrow infers as strings, so str() rendering
+# of numeric cells keeps its pandas semantics.
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+
+# Optional GPU offload: cuDF mirrors the pandas calls used by the numeric
+# comparison kernels below. Equality and string conditions keep their
+# mixed-dtype fallback semantics, which only pandas supports.
+try:
+    import cudf
+except ImportError:
+    cudf = None
+
+# Below this row count host<->device transfer outweighs the kernel win
+GPU_MIN_ROWS = 100_000
+
+# Ordering comparisons dispatch through one table lookup; the functions
+# delegate to the vectorized Series operators. Equality and the string
+# operations have their own mixed-dtype fallback paths below.
+_ORDERING_OPS = {
+    ConditionType.GREATER_THAN: operator.gt,
+    ConditionType.LESS_THAN: operator.lt,
+    ConditionType.GREATER_EQUAL: operator.ge,
+    ConditionType.LESS_EQUAL: operator.le,
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class ValidationResult:
     """Result of applying a rule to a row."""
     row_index: int
@@ -26,7 +62,10 @@ class RuleEngine:
     def __init__(self):
         """Initialize the rule engine."""
         self.results = []
-        self.rule_cache = {}  # Cache for rule results by row
+        self.mask = None  # Flat pass/fail bool array from the last vectorized run
+        self.rule_cache = {}  # Compiled condition evaluators keyed by (column, operator, value)
+        self._cast_cache = {}  # Coerced numeric / cast string columns, reset per validate call
+        self._mask_cache = {}  # Condition masks shared across rules, reset per validate call
         
     def validate(self, data: pd.DataFrame, rules: List[Rule]) -> List[ValidationResult]:
         """
@@ -39,15 +78,463 @@ class RuleEngine:
         Returns:
             List of ValidationResult objects
         """
+        # The default integer index lets the vectorized path reproduce the
+        # per-row messages positionally, so delegate to it: one compiled
+        # boolean mask per rule instead of a Python loop over every row
+        index = data.index
+        if isinstance(index, pd.RangeIndex) and index.start == 0 and index.step == 1:
+            col_arrays = {col: data[col].to_numpy() for col in data.columns}
+            return self.validate_vectorized(col_arrays, rules)
+
         self.results = []
-        
+        self.mask = None
+
         for index, row in data.iterrows():
             for rule in rules:
                 result = self._apply_rule_to_row(row, index, rule)
                 self.results.append(result)
-        
+
         return self.results
     
+    def validate_vectorized(self, col_arrays: Dict[str, Any], rules: List[Rule]) -> List[ValidationResult]:
+        """
+        Vectorized equivalent of validate() operating on column arrays.
+
+        Each rule is compiled to a boolean mask over all rows in one pass
+        (NumPy/pandas column operations) instead of evaluating conditions
+        row by row in Python. Results match validate() in content and order.
+
+        Args:
+            col_arrays: Mapping of column name to a NumPy array of values
+            rules: List of Rule objects to apply
+
+        Returns:
+            List of ValidationResult objects
+        """
+        self.results = []
+        self.mask = None
+        self._cast_cache = {}
+        self._mask_cache = {}
+        if not col_arrays:
+            return self.results
+
+        n_rows = len(next(iter(col_arrays.values())))
+        # One (n_rules, n_rows) boolean matrix instead of a Python list of
+        # arrays: a single allocation, and row lookups below stay in C
+        masks = np.empty((len(rules), n_rows), dtype=bool)
+
+        # Built lazily, at most once, if any rule needs the per-row fallback
+        fallback_frame = None
+
+        # Lets reference rules ('Rule1 AND Rule2') resolve their targets
+        # within the batch being validated
+        by_name = {rule.name: rule for rule in rules}
+
+        def rule_mask(rule):
+            nonlocal fallback_frame
+            try:
+                return self._rule_mask(col_arrays, n_rows, rule, by_name)
+            except Exception:
+                # Anything the vectorized path can't handle falls back to
+                # the per-row evaluator for that rule only
+                if fallback_frame is None:
+                    fallback_frame = pd.DataFrame(col_arrays)
+                frame = fallback_frame
+                return np.fromiter(
+                    (self._apply_rule_to_row(row, i, rule).passed for i, row in frame.iterrows()),
+                    dtype=bool, count=n_rows
+                )
+
+        # Rules are independent and the pandas/NumPy kernels underneath
+        # release the GIL, so a thread pool overlaps their mask
+        # computations; map() keeps results in rule order
+        if len(rules) > 1:
+            workers = min(len(rules), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for j, mask in enumerate(executor.map(rule_mask, rules)):
+                    masks[j] = mask
+        else:
+            for j, rule in enumerate(rules):
+                masks[j] = rule_mask(rule)
+
+        columns = list(col_arrays)
+        # tolist() boxes each column to native Python scalars in one C
+        # call, so row_data renders like the per-row path's
+        # Series.to_dict() (2.5, not np.float64(2.5)) in reports
+        column_values = [np.asarray(arr).tolist() for arr in col_arrays.values()]
+        # Constant per-rule strings hoisted out of the assembly loop, and
+        # the whole matrix converted to Python bools in one C call instead
+        # of a bool() per (row, rule) cell
+        rule_names = [rule.name for rule in rules]
+        rule_actions = [rule.action for rule in rules]
+        # Columnar view of the outcome in result order (row-major over
+        # rules); get_passed/failed_validations select through it
+        self.mask = np.ascontiguousarray(masks.T).reshape(-1)
+        passed_rows = masks.T.tolist()
+        # The final size is known, so fill by index instead of paying the
+        # geometric regrowth of n_rows x n_rules appends
+        results = self.results
+        results.extend([None] * (n_rows * len(rules)))
+        pos = 0
+        for index, values in enumerate(zip(*column_values)):
+            row_data = dict(zip(columns, values))
+            for name, action, passed in zip(rule_names, rule_actions, passed_rows[index]):
+                if passed:
+                    message = f"Row {index}: {action}"
+                else:
+                    message = f"Row {index}: Rule '{name}' not satisfied"
+                results[pos] = ValidationResult(
+                    row_index=index,
+                    rule_name=name,
+                    passed=passed,
+                    message=message,
+                    # Each result owns its dict, like to_dict() per row in
+                    # the per-row path, so mutating one can't leak across
+                    row_data=dict(row_data)
+                )
+                pos += 1
+
+        return self.results
+
+    def evaluate_mask(self, data: pd.DataFrame, rule: Rule) -> np.ndarray:
+        """
+        Compute the pass/fail mask for one rule without building results.
+
+        For callers that only need counts or row selection, this skips
+        the per-row ValidationResult allocation entirely and returns the
+        rule's compiled boolean mask directly.
+
+        Args:
+            data: DataFrame containing the data to validate
+            rule: Rule to apply
+
+        Returns:
+            Boolean NumPy array with one entry per row
+        """
+        col_arrays = {col: data[col].to_numpy() for col in data.columns}
+        n_rows = len(data)
+        self._cast_cache = {}
+        self._mask_cache = {}
+        try:
+            return self._rule_mask(col_arrays, n_rows, rule)
+        except Exception:
+            return np.fromiter(
+                (self._apply_rule_to_row(row, i, rule).passed for i, row in data.iterrows()),
+                dtype=bool, count=n_rows
+            )
+
+    def _rule_mask(self, col_arrays: Dict[str, Any], n_rows: int, rule: Rule,
+                   by_name: Optional[Dict[str, Rule]] = None, _depth: int = 0) -> np.ndarray:
+        """
+        Compute a boolean mask over all rows for a single rule.
+
+        Args:
+            col_arrays: Mapping of column name to a NumPy array of values
+            n_rows: Number of rows
+            rule: Rule to compile
+            by_name: Rules in the current batch, for resolving references
+            _depth: Recursion depth of reference resolution
+
+        Returns:
+            Boolean NumPy array of length n_rows
+        """
+        if rule.rule_references:
+            return self._reference_mask(col_arrays, n_rows, rule, by_name, _depth)
+
+        condition_masks = [
+            self._condition_mask(col_arrays, n_rows, condition)
+            for condition in rule.conditions
+        ]
+        if not condition_masks:
+            return np.zeros(n_rows, dtype=bool)
+
+        # Combine in place: no intermediate boolean arrays are allocated
+        # no matter how many conditions the rule chains together
+        result = condition_masks[0].copy()
+        for i, op in enumerate(rule.logical_ops):
+            if i + 1 < len(condition_masks):
+                if op == LogicalOperator.AND:
+                    np.logical_and(result, condition_masks[i + 1], out=result)
+                elif op == LogicalOperator.OR:
+                    np.logical_or(result, condition_masks[i + 1], out=result)
+        return result
+
+    def _reference_mask(self, col_arrays: Dict[str, Any], n_rows: int, rule: Rule,
+                        by_name: Optional[Dict[str, Rule]], depth: int) -> np.ndarray:
+        """
+        Combine the masks of referenced rules (e.g. 'Rule1 AND Rule2').
+
+        Each referenced rule is evaluated as its own grouped mask and the
+        results are combined left to right, so a rule with internal ORs
+        keeps its grouping — which is why references aren't flattened into
+        one condition list at parse time. The condition masks underneath
+        come out of the per-validate memo, so a rule validated both on its
+        own and through a reference pays for its conditions once.
+
+        Args:
+            col_arrays: Mapping of column name to a NumPy array of values
+            n_rows: Number of rows
+            rule: Rule whose rule_references to combine
+            by_name: Rules in the current batch, for resolving references
+            depth: Current resolution depth, to break reference cycles
+
+        Returns:
+            Boolean NumPy array of length n_rows; all-True when a
+            reference cannot be resolved, matching the per-row placeholder
+        """
+        if not by_name or depth > 8:
+            return np.ones(n_rows, dtype=bool)
+
+        result = None
+        for i, ref in enumerate(rule.rule_references):
+            target = by_name.get(ref.rule_name)
+            if target is None or target is rule:
+                return np.ones(n_rows, dtype=bool)
+            mask = self._rule_mask(col_arrays, n_rows, target, by_name, depth + 1)
+            if result is None:
+                result = mask.copy()
+            elif i - 1 < len(rule.logical_ops) and rule.logical_ops[i - 1] == LogicalOperator.OR:
+                np.logical_or(result, mask, out=result)
+            else:
+                np.logical_and(result, mask, out=result)
+
+        if result is None:
+            return np.ones(n_rows, dtype=bool)
+        return result
+
+    def _condition_mask(self, col_arrays: Dict[str, Any], n_rows: int, condition: Condition) -> np.ndarray:
+        """
+        Compute a boolean mask for a single condition across all rows.
+
+        The condition is compiled once into a reusable evaluator and cached,
+        so repeated validations (and repeated rows of constant work like
+        literal handling and scalar parsing) pay the interpretation cost a
+        single time.
+
+        Args:
+            col_arrays: Mapping of column name to a NumPy array of values
+            n_rows: Number of rows
+            condition: Condition to compile
+
+        Returns:
+            Boolean NumPy array of length n_rows
+        """
+        key = (condition.column, condition.operator, condition.value)
+        # Rules frequently repeat conditions (the same Status="Active" or
+        # X=G check); the first rule to need one computes the mask and the
+        # rest reuse it for the duration of the validate call
+        mask = self._mask_cache.get(key)
+        if mask is None:
+            evaluate = self.rule_cache.get(key)
+            if evaluate is None:
+                evaluate = self._compile_condition(condition)
+                self.rule_cache[key] = evaluate
+            mask = evaluate(col_arrays, n_rows)
+            self._mask_cache[key] = mask
+        return mask
+
+    def _numeric_column(self, col_arrays: Dict[str, Any], column: str) -> pd.Series:
+        """
+        Coerce a column to numeric, cached for the current validate call.
+
+        Several rules typically compare against the same columns; caching
+        the coerced Series means each column pays the to_numeric pass once
+        per validation instead of once per condition. A racing thread at
+        worst coerces the same column twice.
+
+        Args:
+            col_arrays: Mapping of column name to a NumPy array of values
+            column: Column name to coerce
+
+        Returns:
+            Numeric Series with unparseable values as NaN
+        """
+        cached = self._cast_cache.get(column)
+        if cached is None:
+            cached = pd.to_numeric(pd.Series(col_arrays[column]), errors='coerce')
+            self._cast_cache[column] = cached
+        return cached
+
+    def _string_column(self, col_arrays: Dict[str, Any], column: str, upper: bool = False) -> pd.Series:
+        """
+        String-cast a column, cached for the current validate call.
+
+        String conditions lower-case their operand while equality
+        comparisons strip and upper-case; the variants are cached under
+        separate keys, so several needles probing the same column share
+        one cast instead of re-rendering it per condition.
+
+        Args:
+            col_arrays: Mapping of column name to a NumPy array of values
+            column: Column name to cast
+            upper: Strip and upper-case (equality) instead of lower-case
+
+        Returns:
+            String Series in the requested casing
+        """
+        cache_key = ('upper' if upper else 'lower', column)
+        cached = self._cast_cache.get(cache_key)
+        if cached is None:
+            series = pd.Series(col_arrays[column])
+            try:
+                codes, uniques = pd.factorize(series)
+            except TypeError:
+                # Unhashable values can't be factorized
+                codes, uniques = None, None
+            if codes is not None and 0 < len(uniques) and len(uniques) * 2 <= len(series):
+                # Low-cardinality column (status flags and the like):
+                # render each distinct value once and fan the result back
+                # out through the integer codes; -1 codes are the NaNs
+                rendered = pd.Series(uniques).astype(str)
+                rendered = rendered.str.strip().str.upper() if upper else rendered.str.lower()
+                out = rendered.to_numpy(dtype=object)[codes]
+                cached = pd.Series(np.where(codes >= 0, out, np.nan))
+            else:
+                cached = series.astype(str)
+                cached = cached.str.strip().str.upper() if upper else cached.str.lower()
+            self._cast_cache[cache_key] = cached
+        return cached
+
+    def _compile_condition(self, condition: Condition):
+        """
+        Build a vectorized evaluator for a single condition.
+
+        Everything that depends only on the condition itself — literal
+        marker handling, scalar parsing, operator dispatch — happens here,
+        once; the returned callable touches only the data arrays. Semantics
+        mirror _evaluate_condition: numeric coercion with failure -> False,
+        string fallback for equality, case-insensitive string operations.
+
+        Args:
+            condition: Condition to compile
+
+        Returns:
+            Callable taking (col_arrays, n_rows) and returning a boolean
+            NumPy array of length n_rows
+        """
+        column = condition.column
+        op = condition.operator
+
+        # Resolve the comparison value: literal marker, column reference,
+        # or plain scalar — same precedence as _evaluate_condition. Whether
+        # a bare string names a column depends on the data, so that check
+        # stays in the evaluator; literals never reference columns.
+        comparison = condition.value
+        if isinstance(comparison, str) and comparison.startswith('__LITERAL__'):
+            comparison = comparison[len('__LITERAL__'):]
+            may_reference = False
+        else:
+            may_reference = isinstance(comparison, str)
+
+        compare = _ORDERING_OPS.get(op)
+        if compare is not None:
+            try:
+                scalar = float(comparison)
+            except (ValueError, TypeError):
+                scalar = None
+
+            def evaluate(col_arrays, n_rows):
+                if column not in col_arrays:
+                    return np.zeros(n_rows, dtype=bool)
+
+                def mask(to_numeric):
+                    left = to_numeric(col_arrays, column)
+                    if may_reference and comparison in col_arrays:
+                        right = to_numeric(col_arrays, comparison)
+                    elif scalar is not None:
+                        right = scalar
+                    else:
+                        return np.zeros(n_rows, dtype=bool)
+                    return compare(left, right).fillna(False).to_numpy(dtype=bool)
+
+                if cudf is not None and n_rows >= GPU_MIN_ROWS:
+                    try:
+                        return mask(lambda arrays, col: cudf.to_numeric(
+                            cudf.Series(arrays[col]), errors='coerce'))
+                    except Exception:
+                        # Device copy or kernel failure (e.g. an object
+                        # dtype column): fall through to the CPU path
+                        pass
+                return mask(self._numeric_column)
+
+            return evaluate
+
+        if op in (ConditionType.EQUAL, ConditionType.NOT_EQUAL):
+            try:
+                scalar_num = float(comparison)
+                scalar_ok = not np.isnan(scalar_num)
+            except (ValueError, TypeError):
+                scalar_num = np.nan
+                scalar_ok = False
+            scalar_str = str(comparison).strip().upper()
+
+            def evaluate(col_arrays, n_rows):
+                if column not in col_arrays:
+                    return np.zeros(n_rows, dtype=bool)
+                left_num = self._numeric_column(col_arrays, column)
+                left_str = self._string_column(col_arrays, column, upper=True)
+                if may_reference and comparison in col_arrays:
+                    right_num = self._numeric_column(col_arrays, comparison)
+                    right_str = self._string_column(col_arrays, comparison, upper=True)
+                    numeric_ok = left_num.notna() & right_num.notna()
+                else:
+                    right_num = scalar_num
+                    right_str = scalar_str
+                    numeric_ok = left_num.notna() & scalar_ok
+                if op == ConditionType.EQUAL:
+                    mask = np.where(numeric_ok, left_num == right_num, left_str == right_str)
+                else:
+                    mask = np.where(numeric_ok, left_num != right_num, left_str != right_str)
+                return np.asarray(mask, dtype=bool)
+
+            return evaluate
+
+        # String operations: contains / starts_with / ends_with
+        needle = str(comparison).lower()
+
+        def evaluate(col_arrays, n_rows):
+            if column not in col_arrays:
+                return np.zeros(n_rows, dtype=bool)
+            if pa is not None and (not may_reference or comparison not in col_arrays):
+                try:
+                    arr = pa.array(col_arrays[column])
+                    if pa.types.is_string(arr.type) or pa.types.is_large_string(arr.type):
+                        if op == ConditionType.CONTAINS:
+                            hits = pc.match_substring(arr, needle, ignore_case=True)
+                        elif op == ConditionType.STARTS_WITH:
+                            hits = pc.starts_with(arr, needle, ignore_case=True)
+                        elif op == ConditionType.ENDS_WITH:
+                            hits = pc.ends_with(arr, needle, ignore_case=True)
+                        else:
+                            return np.zeros(n_rows, dtype=bool)
+                        return pc.fill_null(hits, False).to_numpy(zero_copy_only=False)
+                except (pa.lib.ArrowInvalid, pa.lib.ArrowNotImplementedError, TypeError):
+                    # Mixed-type column Arrow can't type, or a kernel
+                    # missing for the inferred layout; use the pandas
+                    # str() rendering below
+                    pass
+            left = self._string_column(col_arrays, column)
+            if may_reference and comparison in col_arrays:
+                right = self._string_column(col_arrays, comparison)
+                if op == ConditionType.CONTAINS:
+                    pairs = (r in l for l, r in zip(left, right))
+                elif op == ConditionType.STARTS_WITH:
+                    pairs = (l.startswith(r) for l, r in zip(left, right))
+                else:
+                    pairs = (l.endswith(r) for l, r in zip(left, right))
+                return np.fromiter(pairs, dtype=bool, count=n_rows)
+            if op == ConditionType.CONTAINS:
+                mask = left.str.contains(needle, regex=False)
+            elif op == ConditionType.STARTS_WITH:
+                mask = left.str.startswith(needle)
+            elif op == ConditionType.ENDS_WITH:
+                mask = left.str.endswith(needle)
+            else:
+                return np.zeros(n_rows, dtype=bool)
+            return mask.fillna(False).to_numpy(dtype=bool)
+
+        return evaluate
+
     def _apply_rule_to_row(self, row: pd.Series, index: int, rule: Rule) -> ValidationResult:
         """
         Apply a single rule to a single row.
@@ -204,6 +691,9 @@ class RuleEngine:
         Returns:
             List of failed ValidationResult objects
         """
+        if self.mask is not None and len(self.mask) == len(self.results):
+            results = self.results
+            return [results[i] for i in np.nonzero(~self.mask)[0]]
         return [r for r in self.results if not r.passed]
     
     def get_passed_validations(self) -> List[ValidationResult]:
@@ -213,6 +703,9 @@ class RuleEngine:
         Returns:
             List of passed ValidationResult objects
         """
+        if self.mask is not None and len(self.mask) == len(self.results):
+            results = self.results
+            return [results[i] for i in np.nonzero(self.mask)[0]]
         return [r for r in self.results if r.passed]
     
     def generate_report(self) -> str:
@@ -222,19 +715,20 @@ class RuleEngine:
         Returns:
             Formatted report string
         """
+        failed_results = self.get_failed_validations()
         report = []
         report.append("=" * 80)
         report.append("VALIDATION REPORT")
         report.append("=" * 80)
         report.append(f"Total validations: {len(self.results)}")
-        report.append(f"Passed: {len(self.get_passed_validations())}")
-        report.append(f"Failed: {len(self.get_failed_validations())}")
+        report.append(f"Passed: {len(self.results) - len(failed_results)}")
+        report.append(f"Failed: {len(failed_results)}")
         report.append("=" * 80)
-        
-        if self.get_failed_validations():
+
+        if failed_results:
             report.append("\nFAILED VALIDATIONS:")
             report.append("-" * 80)
-            for result in self.get_failed_validations():
+            for result in failed_results:
                 report.append(f"\n{result.message}")
                 report.append(f"Rule: {result.rule_name}")
                 report.append(f"Row data: {result.row_data}")
@@ -3,13 +3,41 @@ Rule Parser Module
 Parses expression-based rules into executable rule objects.
 """
 import re
+import string
 from typing import Dict, List, Any, Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum
 
 
-class ConditionType(Enum):
-    """Types of conditions supported in rules."""
+# Compiled once at import: these run for every rule line parsed, so large
+# rules files should not pay regex compilation per line
+# The capture group yields the operator sequence and the condition
+# boundaries from a single scan of the expression
+AND_OR_CAPTURE_PATTERN = re.compile(r'\s+(AND|OR)\s+', re.IGNORECASE)
+RULE_REF_PATTERN = re.compile(r'^Rule\d+\s+(AND|OR)\s+Rule\d+', re.IGNORECASE)
+RULE_REF_SPLIT_PATTERN = re.compile(r'\s+(AND|OR)\s+', re.IGNORECASE)
+RULE_NAME_PATTERN = re.compile(r'Rule(\d+)', re.IGNORECASE)
+NAME_SANITIZE_PATTERN = re.compile(r'[^\w\s]')
+# Deletion table equivalent to NAME_SANITIZE_PATTERN for ASCII input;
+# str.translate runs it as a single C-level pass with no regex engine
+_NAME_KEEP = set(string.ascii_letters + string.digits + '_' + string.whitespace)
+NAME_SANITIZE_TABLE = {i: None for i in range(128) if chr(i) not in _NAME_KEEP}
+STRING_OP_PATTERN = re.compile(
+    r'(\w+)\s+(contains|starts_with|ends_with)\s+["\'](.+?)["\']', re.IGNORECASE
+)
+# Comparison operators, two-character ones first so the alternation
+# prefers them over their single-character prefixes
+CMP_OP_PATTERN = re.compile(r'(>=|<=|!=|>|<|=)')
+# Numeric literals as _parse_value accepts them: 5, -3, 2.5, .5, 4.
+NUMBER_PATTERN = re.compile(r'[+-]?(?:\d+\.?\d*|\.\d+)')
+
+
+class ConditionType(str, Enum):
+    """Types of conditions supported in rules.
+
+    The str mixin makes member comparisons plain C-level string compares,
+    which the row-evaluation hot paths hit once per condition.
+    """
     GREATER_THAN = ">"
     LESS_THAN = "<"
     GREATER_EQUAL = ">="
@@ -21,13 +49,30 @@ class ConditionType(Enum):
     ENDS_WITH = "ends_with"
 
 
-class LogicalOperator(Enum):
+STRING_OP_TYPES = {
+    'contains': ConditionType.CONTAINS,
+    'starts_with': ConditionType.STARTS_WITH,
+    'ends_with': ConditionType.ENDS_WITH,
+}
+
+# Comparison-operator lookup built once at import, not per call
+OPERATOR_MAP = {
+    '>': ConditionType.GREATER_THAN,
+    '<': ConditionType.LESS_THAN,
+    '>=': ConditionType.GREATER_EQUAL,
+    '<=': ConditionType.LESS_EQUAL,
+    '=': ConditionType.EQUAL,
+    '!=': ConditionType.NOT_EQUAL,
+}
+
+
+class LogicalOperator(str, Enum):
     """Logical operators for combining conditions."""
     AND = "AND"
     OR = "OR"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Condition:
     """Represents a single condition in a rule."""
     column: str
@@ -50,7 +95,31 @@ class Condition:
         return Condition(column=d['column'], operator=op, value=d['value'])
 
 
-@dataclass
+# Flyweight pool: rules repeat the same comparisons often, so identical
+# (column, operator, value) triples share one frozen Condition. A small
+# bounded dict (no weakrefs, so no weakref_slot requirement on the slotted
+# dataclass) with FIFO eviction like the parser's other caches.
+_CONDITION_POOL: Dict[tuple, Condition] = {}
+_CONDITION_POOL_MAX = 1024
+
+
+def _make_condition(column: str, operator: ConditionType, value: Any) -> Condition:
+    """Return the pooled Condition for this triple, creating it if needed."""
+    key = (column, operator, value)
+    try:
+        condition = _CONDITION_POOL.get(key)
+    except TypeError:
+        # Unhashable value; skip the pool for this one
+        return Condition(column=column, operator=operator, value=value)
+    if condition is None:
+        condition = Condition(column=column, operator=operator, value=value)
+        if len(_CONDITION_POOL) >= _CONDITION_POOL_MAX:
+            _CONDITION_POOL.pop(next(iter(_CONDITION_POOL)))
+        _CONDITION_POOL[key] = condition
+    return condition
+
+
+@dataclass(frozen=True, slots=True)
 class RuleReference:
     """Represents a reference to another rule by name."""
     rule_name: str
@@ -66,7 +135,7 @@ class RuleReference:
         return RuleReference(rule_name=d['rule_name'])
 
 
-@dataclass
+@dataclass(slots=True)
 class Rule:
     """Represents a complete validation rule."""
     name: str
@@ -82,12 +151,12 @@ class Rule:
             self.rule_references = []
     
     def __str__(self):
-        cond_str = ""
+        parts = []
         for i, condition in enumerate(self.conditions):
-            cond_str += str(condition)
+            parts.append(str(condition))
             if i < len(self.logical_ops):
-                cond_str += f" {self.logical_ops[i].value} "
-        return f"Rule: {self.name}\nConditions: {cond_str}\nAction: {self.action}"
+                parts.append(f" {self.logical_ops[i].value} ")
+        return f"Rule: {self.name}\nConditions: {''.join(parts)}\nAction: {self.action}"
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -132,6 +201,17 @@ class RuleParser:
         """Initialize the rule parser."""
         self.rules = []
         self.rules_by_name = {}
+        # Memoized parse results keyed on (expression, columns, rule name);
+        # identical rule texts recur often in interactive/GUI sessions
+        self._parse_cache = {}
+        # Lowercase column lookup tables keyed on the identity of the
+        # columns sequence; callers pass the same object for every rule of
+        # a parsing session, so the table is built once per dataset
+        self._col_map_cache = {}
+        # Expression-level memo, shared across rule names: the same
+        # expression under a different name only re-stamps the Rule and
+        # skips the scan/split work entirely
+        self._expr_cache = {}
         
     def parse_rule(self, expression: str, available_columns: List[str], rule_name: str = None) -> Rule:
         """
@@ -151,14 +231,39 @@ class RuleParser:
         # Generate or use provided rule name
         if not rule_name:
             rule_name = self._generate_rule_name(expression)
-        
+
+        # Re-parsing the same expression against the same columns is common
+        # (GUI sessions, repeated CLI runs); serve it from the memo cache.
+        # Keyed on the identity of the columns sequence — the entry pins it,
+        # so a matching id always means the same object — which avoids
+        # building a tuple of every column name per call
+        cache_key = (expression, id(available_columns), rule_name)
+        cached = self._parse_cache.get(cache_key)
+        if cached is not None and cached[0] is available_columns:
+            return cached[1]
+
         # Check if this is a rule reference combination (e.g., "Rule1 AND Rule2")
         if self._is_rule_reference_expression(expression):
-            return self._parse_rule_references(expression, rule_name)
-        
-        # Parse as normal expression
-        conditions, logical_ops, action = self._parse_expression(expression, available_columns)
-        
+            rule = self._parse_rule_references(expression, rule_name)
+            self._cache_store(cache_key, available_columns, rule)
+            return rule
+
+        # Parse as normal expression. The parts are memoized independently
+        # of the rule name; hits hand each Rule fresh lists over the shared
+        # pooled conditions
+        expr_key = (expression, id(available_columns))
+        entry = self._expr_cache.get(expr_key)
+        if entry is not None and entry[0] is available_columns:
+            parts = entry[1]
+            conditions, logical_ops, action = list(parts[0]), list(parts[1]), parts[2]
+        else:
+            conditions, logical_ops, action = self._parse_expression(expression, available_columns)
+            if len(self._expr_cache) >= 1024:
+                self._expr_cache.pop(next(iter(self._expr_cache)))
+            self._expr_cache[expr_key] = (
+                available_columns, (tuple(conditions), tuple(logical_ops), action)
+            )
+
         rule = Rule(
             name=rule_name,
             conditions=conditions,
@@ -174,17 +279,41 @@ class RuleParser:
             existing.action = action
             existing.description = expression
             existing.rule_references = []
+            # Cached entries for this name now describe a stale expression
+            self._parse_cache = {
+                key: value for key, value in self._parse_cache.items()
+                if key[2] != rule_name
+            }
+            self._cache_store(cache_key, available_columns, existing)
             return existing
 
+        self._register(rule)
+        self._cache_store(cache_key, available_columns, rule)
+        return rule
+
+    def _register(self, rule: Rule) -> Rule:
+        """Record a newly parsed rule in the list and name lookup."""
         self.rules.append(rule)
-        self.rules_by_name[rule_name] = rule
+        self.rules_by_name[rule.name] = rule
         return rule
+
+    def _cache_store(self, cache_key, available_columns, rule: Rule) -> None:
+        """Memoize a parse result, evicting the oldest entry when full."""
+        if len(self._parse_cache) >= 1024:
+            # Dicts preserve insertion order, so the first key is oldest
+            self._parse_cache.pop(next(iter(self._parse_cache)))
+        self._parse_cache[cache_key] = (available_columns, rule)
+
+    def invalidate_cache(self) -> None:
+        """Drop all memoized parse results and column lookup tables."""
+        self._parse_cache.clear()
+        self._col_map_cache.clear()
+        self._expr_cache.clear()
     
     def _is_rule_reference_expression(self, expression: str) -> bool:
         """Check if expression is a rule reference combination."""
-        # Pattern for Rule references like "Rule1 AND Rule2"
-        pattern = r'^Rule\d+\s+(AND|OR)\s+Rule\d+'
-        return bool(re.match(pattern, expression, re.IGNORECASE))
+        # Matches Rule references like "Rule1 AND Rule2"
+        return bool(RULE_REF_PATTERN.match(expression))
     
     def _parse_rule_references(self, expression: str, rule_name: str) -> Rule:
         """Parse rule reference combinations like 'Rule1 AND Rule2'."""
@@ -193,15 +322,16 @@ class RuleParser:
         rule_refs = []
         
         # Find all AND/OR operators
-        parts = re.split(r'\s+(AND|OR)\s+', expression, flags=re.IGNORECASE)
-        
-        for i, part in enumerate(parts):
+        parts = RULE_REF_SPLIT_PATTERN.split(expression)
+
+        for part in parts:
             part = part.strip()
-            if part.upper() in ['AND', 'OR']:
-                logical_ops.append(LogicalOperator.AND if part.upper() == 'AND' else LogicalOperator.OR)
+            part_upper = part.upper()
+            if part_upper in ('AND', 'OR'):
+                logical_ops.append(LogicalOperator.AND if part_upper == 'AND' else LogicalOperator.OR)
             elif part:
                 # Extract rule name
-                match = re.match(r'Rule(\d+)', part, re.IGNORECASE)
+                match = RULE_NAME_PATTERN.match(part)
                 if match:
                     rule_refs.append(RuleReference(rule_name=part))
         
@@ -213,15 +343,17 @@ class RuleParser:
             description=expression,
             rule_references=rule_refs
         )
-        
-        self.rules.append(rule)
-        self.rules_by_name[rule_name] = rule
-        return rule
+
+        return self._register(rule)
     
     def _generate_rule_name(self, expression: str) -> str:
         """Generate a rule name from the expression."""
-        # Use first part of expression, sanitized
-        name = re.sub(r'[^\w\s]', '', expression)[:30]
+        # Use first part of expression, sanitized; the regex only runs for
+        # non-ASCII input, where \w covers more than the translate table
+        if expression.isascii():
+            name = expression.translate(NAME_SANITIZE_TABLE)[:30]
+        else:
+            name = NAME_SANITIZE_PATTERN.sub('', expression)[:30]
         name = "_".join(name.split())
         return name if name else f"rule_{len(self.rules) + 1}"
     
@@ -242,30 +374,31 @@ class RuleParser:
         logical_ops = []
         action = "validation ok"
         
-        # Split by AND and OR (case-insensitive)
-        # First, identify logical operators and their positions
-        and_pattern = re.compile(r'\bAND\b', re.IGNORECASE)
-        or_pattern = re.compile(r'\bOR\b', re.IGNORECASE)
-        
-        and_matches = [(m.start(), LogicalOperator.AND) for m in and_pattern.finditer(expression)]
-        or_matches = [(m.start(), LogicalOperator.OR) for m in or_pattern.finditer(expression)]
-        
-        all_ops = sorted(and_matches + or_matches, key=lambda x: x[0])
-        logical_ops = [op[1] for op in all_ops]
-        
-        # Split by AND/OR to get condition parts
-        condition_parts = re.split(r'\s+AND\s+|\s+OR\s+', expression, flags=re.IGNORECASE)
-        
+        # Split by AND and OR (case-insensitive): one scan collects the
+        # operator sequence and the condition substrings together
+        condition_parts = []
+        last = 0
+        for match in AND_OR_CAPTURE_PATTERN.finditer(expression):
+            condition_parts.append(expression[last:match.start()])
+            logical_ops.append(
+                LogicalOperator.AND if match.group(1).upper() == 'AND' else LogicalOperator.OR
+            )
+            last = match.end()
+        condition_parts.append(expression[last:])
+
+        # Bound locals keep the loop free of repeated attribute lookups
+        parse_single = self._parse_single_condition
+        add_condition = conditions.append
         for part in condition_parts:
             part = part.strip()
             # Remove surrounding parentheses
             part = part.strip('()')
-            
+
             if part:
-                condition = self._parse_single_condition(part, available_columns)
+                condition = parse_single(part, available_columns)
                 if condition:
-                    conditions.append(condition)
-        
+                    add_condition(condition)
+
         return conditions, logical_ops, action
     
     def _parse_single_condition(
@@ -288,79 +421,79 @@ class RuleParser:
             Condition object or None
         """
         condition_text = condition_text.strip()
-        
-        # Check for 'contains', 'starts_with', 'ends_with' operators
-        if 'contains' in condition_text.lower():
-            return self._parse_string_operation(condition_text, available_columns, ConditionType.CONTAINS)
-        elif 'starts_with' in condition_text.lower():
-            return self._parse_string_operation(condition_text, available_columns, ConditionType.STARTS_WITH)
-        elif 'ends_with' in condition_text.lower():
-            return self._parse_string_operation(condition_text, available_columns, ConditionType.ENDS_WITH)
-        
-        # Parse comparison operators (>=, <=, !=, >, <, =)
-        operators = ['>=', '<=', '!=', '>', '<', '=']
-        
-        for op_str in operators:
-            if op_str in condition_text:
-                parts = condition_text.split(op_str, 1)
-                if len(parts) == 2:
-                    left = parts[0].strip()
-                    right = parts[1].strip()
-                    
-                    # Determine which is column and which is value
-                    column, value = self._identify_column_and_value(left, right, available_columns)
-                    
-                    if column:
-                        # Map operator string to ConditionType
-                        op_type = self._map_operator(op_str)
-                        return Condition(column=column, operator=op_type, value=value)
-        
-        return None
-    
-    def _parse_string_operation(
-        self, condition_text: str, available_columns: List[str], op_type: ConditionType
-    ) -> Optional[Condition]:
-        """Parse string operations like 'A contains "cc_r"'."""
-        # Pattern: column_name contains "value"
-        pattern = r'(\w+)\s+(contains|starts_with|ends_with)\s+["\'](.+?)["\']'
-        match = re.match(pattern, condition_text, re.IGNORECASE)
-        
+
+        # Parse comparison operators (>=, <=, !=, >, <, =) first: they are
+        # the common case and need only one alternation search, splitting
+        # at the leftmost operator in the text
+        match = CMP_OP_PATTERN.search(condition_text)
         if match:
-            column_name = match.group(1)
-            value = match.group(3)
-            
-            # Find actual column name (case-insensitive)
-            column = self._find_column(column_name, available_columns)
+            left = condition_text[:match.start()].strip()
+            right = condition_text[match.end():].strip()
+
+            # Determine which is column and which is value
+            column, value = self._identify_column_and_value(left, right, available_columns)
+
             if column:
-                return Condition(column=column, operator=op_type, value=value)
-        
+                # Map operator string to ConditionType
+                op_type = self._map_operator(match.group(1))
+                return _make_condition(column, op_type, value)
+
+        # Check for string operations like 'A contains "cc_r"': the one
+        # anchored match both detects the operator and captures the column
+        # and quoted value
+        string_match = STRING_OP_PATTERN.match(condition_text)
+        if string_match:
+            column = self._find_column(string_match.group(1), available_columns)
+            if column:
+                op_type = STRING_OP_TYPES[string_match.group(2).lower()]
+                return _make_condition(column, op_type, string_match.group(3))
+
         return None
     
     def _identify_column_and_value(
         self, left: str, right: str, available_columns: List[str]
     ) -> Tuple[Optional[str], Any]:
         """Identify which side is the column and which is the value."""
+        # Fetch the lookup table once for both sides
+        col_map = self._column_map(available_columns)
+
         # Try left as column
-        left_col = self._find_column(left, available_columns)
+        left_col = col_map.get(left.strip().lower())
         if left_col:
             value = self._parse_value(right, available_columns)
             return left_col, value
-        
+
         # Try right as column
-        right_col = self._find_column(right, available_columns)
+        right_col = col_map.get(right.strip().lower())
         if right_col:
             value = self._parse_value(left, available_columns)
             return right_col, value
-        
+
         return None, None
     
+    def _column_map(self, available_columns: List[str]) -> Dict[str, str]:
+        """Get the lowercase -> original column table for a columns sequence.
+
+        Keyed on the identity of the sequence; the cached entry keeps a
+        reference to it so the id cannot be recycled while cached. First
+        occurrence wins on case-insensitive duplicates, matching the old
+        linear scan.
+        """
+        key = id(available_columns)
+        entry = self._col_map_cache.get(key)
+        if entry is not None and entry[0] is available_columns:
+            return entry[1]
+        col_map = {}
+        for col in available_columns:
+            col_map.setdefault(col.lower(), col)
+        if len(self._col_map_cache) > 8:
+            self._col_map_cache.clear()
+        self._col_map_cache[key] = (available_columns, col_map)
+        return col_map
+
     def _find_column(self, name: str, available_columns: List[str]) -> Optional[str]:
         """Find column name (case-insensitive match)."""
-        name = name.strip()
-        for col in available_columns:
-            if col.lower() == name.lower() or col == name:
-                return col
-        return None
+        return self._column_map(available_columns).get(name.strip().lower())
     
     def _parse_value(self, value_str: str, available_columns: List[str]) -> Any:
         """Parse a value, which can be a number, string, or column reference."""
@@ -378,29 +511,20 @@ class RuleParser:
         if col:
             return col
         
-        # Try to parse as number
-        try:
+        # Try to parse as number; the full-pattern check replaces
+        # raise-and-catch conversion entirely, since the matched forms can
+        # never fail int() or float()
+        if NUMBER_PATTERN.fullmatch(value_str):
             if '.' in value_str:
                 return float(value_str)
-            else:
-                return int(value_str)
-        except ValueError:
-            pass
+            return int(value_str)
         
         # Return as string (for backward compatibility with unquoted strings like YES/NO)
         return value_str
     
     def _map_operator(self, op_str: str) -> ConditionType:
         """Map operator string to ConditionType."""
-        mapping = {
-            '>': ConditionType.GREATER_THAN,
-            '<': ConditionType.LESS_THAN,
-            '>=': ConditionType.GREATER_EQUAL,
-            '<=': ConditionType.LESS_EQUAL,
-            '=': ConditionType.EQUAL,
-            '!=': ConditionType.NOT_EQUAL,
-        }
-        return mapping.get(op_str, ConditionType.EQUAL)
+        return OPERATOR_MAP.get(op_str, ConditionType.EQUAL)
     
     def get_rules(self) -> List[Rule]:
         """